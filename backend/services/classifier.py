@@ -1,10 +1,11 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
+from typing import List
 try:
-    from backend.utils.models import load_pickle, get_model_path
+    from backend.utils.models import load_pickle, get_model_path, build_label_index, predict_with_scores
     from backend.utils.preprocessing import preprocess_text
 except ImportError:
-    from utils.models import load_pickle, get_model_path
+    from utils.models import load_pickle, get_model_path, build_label_index, predict_with_scores
     from utils.preprocessing import preprocess_text
 import os
 
@@ -19,17 +20,26 @@ print(">>> [Classifier] Loading models...")
 # Global model variables
 pipeline = None
 label_encoder = None
+label_index = None
 
 def load_classifier_models():
-    global pipeline, label_encoder
+    global pipeline, label_encoder, label_index
     if pipeline is None:
         print(">>> [Classifier] Loading models...")
         pipeline = load_pickle(PIPELINE_PATH)
         label_encoder = load_pickle(LABEL_PATH)
+        if pipeline is not None:
+            label_index = build_label_index(pipeline, label_encoder)
         print(">>> [Classifier] Models loaded.")
 
 class CaseInput(BaseModel):
     text: str
+    return_scores: bool = False
+    top_k: int = 3
+
+class CaseBatchInput(BaseModel):
+    texts: List[str]
+    top_k: int = 3
 
 @router.post("/classify")
 async def classify_case(case: CaseInput):
@@ -41,7 +51,35 @@ async def classify_case(case: CaseInput):
         raise HTTPException(status_code=500, detail="Classification model not loaded.")
     
     cleaned = preprocess_text(case.text)
-    pred_enc = pipeline.predict([cleaned])
-    pred_label = label_encoder.inverse_transform(pred_enc)[0] if label_encoder else str(pred_enc[0])
-    
-    return {"category": pred_label}
+    result = predict_with_scores(pipeline, label_index, [cleaned], case.top_k)[0]
+
+    if not case.return_scores:
+        return {"category": result["label"]}
+    return {
+        "category": result["label"],
+        "score_type": result["score_type"],
+        "scores": result["scores"],
+        "top_k": result["top_k"],
+    }
+
+@router.post("/classify/batch")
+async def classify_batch(batch: CaseBatchInput):
+    load_classifier_models()
+    if not batch.texts or any(not t.strip() for t in batch.texts):
+        raise HTTPException(status_code=400, detail="Text input is empty.")
+
+    if pipeline is None:
+        raise HTTPException(status_code=500, detail="Classification model not loaded.")
+
+    cleaned = [preprocess_text(t) for t in batch.texts]
+    results = predict_with_scores(pipeline, label_index, cleaned, batch.top_k)
+
+    return {"results": [
+        {
+            "category": r["label"],
+            "score_type": r["score_type"],
+            "scores": r["scores"],
+            "top_k": r["top_k"],
+        }
+        for r in results
+    ]}
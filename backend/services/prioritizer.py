@@ -1,9 +1,10 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
+from typing import List
 try:
-    from backend.utils.models import load_pickle, get_model_path
+    from backend.utils.models import load_pickle, get_model_path, build_label_index, predict_with_scores
 except ImportError:
-    from utils.models import load_pickle, get_model_path
+    from utils.models import load_pickle, get_model_path, build_label_index, predict_with_scores
 try:
     from backend.utils.preprocessing import preprocess_text
 except ImportError:
@@ -21,17 +22,26 @@ print(">>> [Prioritizer] Loading models...")
 # Global model variables
 pipeline = None
 label_encoder = None
+label_index = None
 
 def load_prioritizer_models():
-    global pipeline, label_encoder
+    global pipeline, label_encoder, label_index
     if pipeline is None:
         print(">>> [Prioritizer] Loading models...")
         pipeline = load_pickle(PIPELINE_PATH)
         label_encoder = load_pickle(LABEL_PATH)
+        if pipeline is not None:
+            label_index = build_label_index(pipeline, label_encoder)
         print(">>> [Prioritizer] Models loaded.")
 
 class CaseInput(BaseModel):
     text: str
+    return_scores: bool = False
+    top_k: int = 3
+
+class CaseBatchInput(BaseModel):
+    texts: List[str]
+    top_k: int = 3
 
 @router.post("/prioritize")
 async def prioritize_case(case: CaseInput):
@@ -43,7 +53,35 @@ async def prioritize_case(case: CaseInput):
         raise HTTPException(status_code=500, detail="Prioritization model not loaded.")
     
     cleaned = preprocess_text(case.text)
-    pred_enc = pipeline.predict([cleaned])
-    pred_label = label_encoder.inverse_transform(pred_enc)[0] if label_encoder else str(pred_enc[0])
-    
-    return {"priority": pred_label}
+    result = predict_with_scores(pipeline, label_index, [cleaned], case.top_k)[0]
+
+    if not case.return_scores:
+        return {"priority": result["label"]}
+    return {
+        "priority": result["label"],
+        "score_type": result["score_type"],
+        "scores": result["scores"],
+        "top_k": result["top_k"],
+    }
+
+@router.post("/prioritize/batch")
+async def prioritize_batch(batch: CaseBatchInput):
+    load_prioritizer_models()
+    if not batch.texts or any(not t.strip() for t in batch.texts):
+        raise HTTPException(status_code=400, detail="Text input is empty.")
+
+    if pipeline is None:
+        raise HTTPException(status_code=500, detail="Prioritization model not loaded.")
+
+    cleaned = [preprocess_text(t) for t in batch.texts]
+    results = predict_with_scores(pipeline, label_index, cleaned, batch.top_k)
+
+    return {"results": [
+        {
+            "priority": r["label"],
+            "score_type": r["score_type"],
+            "scores": r["scores"],
+            "top_k": r["top_k"],
+        }
+        for r in results
+    ]}
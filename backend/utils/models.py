@@ -1,5 +1,6 @@
 import os
 import pickle
+import numpy as np
 import warnings
 from sklearn.exceptions import InconsistentVersionWarning
 
@@ -48,3 +49,34 @@ def load_pickle(path: str):
     except Exception as e:
         print(f"Error loading {path}: {e}")
         return None
+
+def build_label_index(pipeline, label_encoder):
+    """Map each score column of the pipeline to its decoded label, once at load time."""
+    classes = np.asarray(pipeline.classes_)
+    if label_encoder is None:
+        return classes.astype(str)
+    return np.asarray(label_encoder.classes_)[classes]
+
+def predict_with_scores(pipeline, label_index, texts, top_k=3):
+    """Predict labels, per-class scores and top-k labels from a single ensemble pass."""
+    if hasattr(pipeline, "predict_proba"):
+        scores, score_type = pipeline.predict_proba(texts), "probability"
+    else:
+        scores, score_type = pipeline.decision_function(texts), "decision_function"
+        if scores.ndim == 1:
+            scores = np.column_stack([-scores, scores])
+
+    k = max(1, min(top_k, scores.shape[1]))
+    order = np.argsort(-scores, axis=1, kind="stable")[:, :k]
+    top_labels = label_index[order]
+    top_scores = np.take_along_axis(scores, order, axis=1)
+
+    results = []
+    for row, labels, values in zip(scores, top_labels, top_scores):
+        results.append({
+            "label": str(labels[0]),
+            "score_type": score_type,
+            "scores": {str(label): float(s) for label, s in zip(label_index, row)},
+            "top_k": [{"label": str(l), "score": float(s)} for l, s in zip(labels, values)],
+        })
+    return results